@@ -1,3 +1,4 @@
+import logging
 import random
 from threading import Thread
 import time
@@ -10,6 +11,8 @@ from typing import Callable
 
 type Dice = tuple[int, int]
 
+logger = logging.getLogger(__name__)
+
 
 class Backgammon:
     _history: list[GameState]
@@ -114,6 +117,20 @@ class Backgammon:
     def state(self):
         return self._history[-1].model_copy(deep=True)
 
+    def _next_state(self) -> GameState:
+        # hand-rolled copy for the move functions: the fields are already
+        # validated, and model_copy(deep=True) dominated the AI search cost
+        state = self._history[-1]
+        return GameState.model_construct(
+            board=list(state.board),
+            bar=dict(state.bar),
+            home=dict(state.home),
+            current_turn=state.current_turn,
+            dice=state.dice,
+            moves_left=list(state.moves_left),
+            score=dict(state.score),
+        )
+
     @property
     def history(self):
         return self._history[:-1]
@@ -148,27 +165,23 @@ class Backgammon:
         return [dice[0], dice[1]]
 
     def is_valid_move(self, start: int, end: int) -> bool:
-        piece_type = self.get_piece_type(self.current_turn)
-        board_range = range(24)
-        board = self.board
-        if start not in board_range or end not in board_range:
+        if not (0 <= start < 24 and 0 <= end < 24):
             return False
+        piece_type = self.get_piece_type(self.current_turn)
         if (start - end) * piece_type > 0:
             return False
+        board = self.board
         if board[start] * piece_type <= 0:
             return False
         if board[end] * piece_type < -1:
             return False
-        die = abs(end - start)
-        if die not in self.moves_left:
-            return False
-        return True
+        return abs(end - start) in self.moves_left
 
     def make_move(self, start: int, end: int) -> bool:
         if not self.is_valid_move(start, end):
             return False
 
-        new_state = self.state  # Save state before making a move
+        new_state = self._next_state()  # Save state before making a move
         piece_type = self.get_piece_type(new_state.current_turn)
         new_state.board[start] -= piece_type
 
@@ -195,7 +208,7 @@ class Backgammon:
         if not self.can_leave_bar(end):
             return False
 
-        new_state = self.state
+        new_state = self._next_state()
         piece_type = self.get_piece_type(new_state.current_turn)
 
         new_state.bar[self.current_turn] -= 1
@@ -228,7 +241,7 @@ class Backgammon:
         return positions
 
     def switch_turn(self) -> Dice:
-        print("switched turn")
+        logger.debug("switched turn")
         self._history = [self._history[-1]]
         state = self._history[0]
         state.current_turn = (Player.other(self.current_turn))
@@ -236,12 +249,11 @@ class Backgammon:
         state.moves_left = self.get_moves_from_dice(self.state.dice)
 
     def is_bearing_off(self) -> bool:
-        home_range = self.get_home_range(self.current_turn)
-        piece_type = self.get_piece_type(self.current_turn)
-        return not any(
-            (pieces * piece_type > 0 and position not in home_range)
-            for position, pieces in enumerate(self.board)
-        )
+        # bearing off requires every piece to be inside the home range
+        board = self.board
+        if self.current_turn == Player.player1:
+            return not any(pieces > 0 for pieces in board[:18])
+        return not any(pieces < 0 for pieces in board[6:])
 
     def can_bear_off(self, position: int, die: int) -> bool:
         home_range = self.get_home_range(self.current_turn)
@@ -249,8 +261,9 @@ class Backgammon:
             return False
 
         piece_type = self.get_piece_type(self.current_turn)
+        board = self.board
         occupied_positions = [
-            position for position in home_range if self.board[position] * piece_type > 0
+            position for position in home_range if board[position] * piece_type > 0
         ]
         if len(occupied_positions) == 0:
             return False
@@ -279,7 +292,7 @@ class Backgammon:
         if not any(self.can_bear_off(start, die) for die in self.moves_left):
             return False
 
-        new_state = self.state
+        new_state = self._next_state()
 
         min_die = 24 - start if Player.player1 == new_state.current_turn else start + 1
 
@@ -330,11 +343,22 @@ class Backgammon:
         if self.bar[self.current_turn] > 0:
             return []
         placements: list[int] = []
-        for position in self.enumerate_board():
-            if (
-                len(self.get_possible_tracks(position)) > 0
-            ):
-                placements.append(position)
+        board = self.board
+        piece_type = self.get_piece_type(self.current_turn)
+        moves_left = self.moves_left
+        for position, placement in enumerate(board):
+            if placement * piece_type <= 0:
+                continue
+            # a piece is movable as soon as one die gives a legal landing
+            for die in moves_left:
+                end = position + die * piece_type
+                if 0 <= end < 24:
+                    if board[end] * piece_type >= -1:
+                        placements.append(position)
+                        break
+                elif self.can_bear_off(position, die):
+                    placements.append(position)
+                    break
         return placements
 
     def is_start_valid(self, start: int):
@@ -350,12 +374,18 @@ class Backgammon:
 
         possible_tracks: list[int] = []
 
+        board = self.board
         piece_type = self.get_piece_type(self.current_turn)
         for die in self.moves_left:
             end = start + die * piece_type
-            if (
-                self.is_valid_move(start, end) or self.can_bear_off(start, die)
-            ) and end not in possible_tracks:
+            if end in possible_tracks:
+                continue
+            if 0 <= end < 24:
+                # start is already validated and the die comes from
+                # moves_left, so only the landing point needs checking
+                if board[end] * piece_type >= -1:
+                    possible_tracks.append(end)
+            elif self.can_bear_off(start, die):
                 possible_tracks.append(end)
         return possible_tracks
 
@@ -378,14 +408,17 @@ class Backgammon:
     def has_history(self) -> bool:
         return len(self._history) > 1
 
+    _MOVE_DISPATCH: dict[MoveType, Callable[["Backgammon", Move], bool]] = {
+        MoveType.normal_move: lambda game, move: game.make_move(
+            start=move.start, end=move.end
+        ),
+        MoveType.bear_off: lambda game, move: game.bear_off(move.start),
+        MoveType.leave_bar: lambda game, move: game.leave_bar(move.end),
+    }
+
     def handle_move(self, move: Move):
-        match move.move_type:
-            case MoveType.normal_move:
-                print(self.make_move(start=move.start, end=move.end))
-            case MoveType.bear_off:
-                print(self.bear_off(move.start))
-            case MoveType.leave_bar:
-                print(self.leave_bar(move.end))
+        handled = self._MOVE_DISPATCH[move.move_type](self, move)
+        logger.debug("handled %s: %s", move.move_type, handled)
 
 
 from pydantic_extra_types.color import Color
@@ -471,6 +504,11 @@ class BackgammonAI:
     PIECE_BEARING_OFF = 1
     BAR = 1
 
+    # transposition table: search results keyed by the full game position,
+    # shared across turns since the evaluation is deterministic
+    _TABLE_SIZE = 65536
+    _transposition_table: dict[tuple, ScoredMoves] = {}
+
     @classmethod
     def _evaluate_game_state(cls, state: GameState):
         score = 0
@@ -577,8 +615,36 @@ class BackgammonAI:
 
         return possible_moves
 
+    @classmethod
+    def _position_key(cls, game: Backgammon) -> tuple:
+        # home counts are derivable from board + bar, so they can be omitted
+        return (
+            tuple(game.board),
+            game.bar[Player.player1],
+            game.bar[Player.player2],
+            tuple(sorted(game.moves_left)),
+            game.current_turn,
+        )
+
     @classmethod
     def _threaded_get_best_move(cls, game: Backgammon) -> ScoredMoves:
+        key = cls._position_key(game)
+        cached = cls._transposition_table.get(key)
+        if cached is not None:
+            # callers append to the returned moves, so hand back a copy
+            return ScoredMoves(score=cached.score, moves=list(cached.moves))
+
+        result = cls._search_best_move(game)
+
+        if len(cls._transposition_table) >= cls._TABLE_SIZE:
+            cls._transposition_table.pop(next(iter(cls._transposition_table)))
+        cls._transposition_table[key] = ScoredMoves(
+            score=result.score, moves=list(result.moves)
+        )
+        return result
+
+    @classmethod
+    def _search_best_move(cls, game: Backgammon) -> ScoredMoves:
 
         number_of_moves = len(game.moves_left)
 
@@ -591,7 +657,7 @@ class BackgammonAI:
         if game.get_captured_pieces() > 0:  # AI has captured pieces
             best_scored_moves = ScoredMoves(moves=[], score=-1000)
             bar_leaveing_positions = game.get_bar_leaving_positions()
-            print("Bar Leaving positions: ", bar_leaveing_positions)
+            logger.debug("Bar Leaving positions: %s", bar_leaveing_positions)
             for end in bar_leaveing_positions:
                 game.leave_bar(end)
                 scored_moves = cls._threaded_get_best_move(game=game)
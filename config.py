@@ -1,3 +1,4 @@
+import functools
 import math
 from typing import Literal
 import pygame
@@ -13,25 +14,14 @@ GAME_PORT = 6324
 RESOLUTION: tuple[int, int] = (1280, 720)
 SCREEN = pygame.Rect(0, 0, 1280, 720)
 FRAMERATE: int = 60
+# menu screens are mostly static, so they tick at half the game rate
+MENU_FRAMERATE: int = 30
 BUTTON_COLOR = pygame.Color(200, 0, 0)
 BUTTON_HOVER_COLOR = pygame.Color(250, 250, 250)
 BACKGROUND = pygame.transform.scale(
     pygame.image.load(asset(os.path.join("assets", "images", "background.jpg"))),
     (1280, 720),
 )
-OPTIONS_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "settings.png"))), (60, 60)
-)
-GAME_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "backgammon.png"))),
-    (60, 60),
-)
-VOLUME_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "volume.png"))), (60, 60)
-)
-MUTE_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "mute.png"))), (60, 60)
-)
 
 type x = dict[Literal["button"], str]
 
@@ -42,5 +32,13 @@ TIMER_SOUND = GameSound(key="timer", path=asset(os.path.join("assets", "sounds",
 
 TIMER = 20
 
+@functools.lru_cache(maxsize=32)
 def get_font(size: int, bold=False, italic=False) -> pygame.font.Font:
-    return pygame.font.SysFont("Cooper Black", size, bold, italic)
\ No newline at end of file
+    return pygame.font.SysFont("Cooper Black", size, bold, italic)
+
+
+@functools.lru_cache(maxsize=8)
+def get_icon(name: str, size: tuple[int, int] = (60, 60)) -> pygame.Surface:
+    return pygame.transform.scale(
+        pygame.image.load(asset(os.path.join("assets", "images", name))), size
+    )
\ No newline at end of file
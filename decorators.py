@@ -1,4 +1,5 @@
 import functools
+import logging
 from threading import Timer, Thread
 from time import sleep
 import time
@@ -6,6 +7,8 @@ from typing import Any, Callable
 
 from game_manager import GameManager
 
+logger = logging.getLogger(__name__)
+
 
 def debounce(timeout: float):
     """
@@ -74,7 +77,7 @@ def run_threaded(daemon=False):
         def wrapper(*args, **kwargs) -> Thread:
             thread = Thread(target=func, args=args, kwargs=kwargs, daemon=daemon)
             thread.start()
-            print(f"Ran {wrapper.__name__} on {thread}")
+            logger.debug("Ran %s on %s", wrapper.__name__, thread)
             return thread
 
         return wrapper
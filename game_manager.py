@@ -30,7 +30,7 @@ class GameManager:
         pygame.display.set_caption("Backgammon")
         cls.clock = pygame.time.Clock()
         cls.screen = pygame.display.set_mode(config.RESOLUTION)
-        pygame.display.set_icon(config.GAME_ICON)
+        pygame.display.set_icon(config.get_icon("backgammon.png"))
         cls.sound_manager = SoundManager(
             sounds={
                 **config.BUTTON_SOUND.dump(),
@@ -10,6 +10,89 @@ from models import Position
 
 type RelativePosition = Literal["top", "bottom", "left", "right"]
 
+# fblits (pygame-ce) skips per-call argument parsing; fall back to blits
+_batch_blit = getattr(pygame.Surface, "fblits", pygame.Surface.blits)
+
+# divisors for the dimmed "disabled" variant of a color
+_HALF = pygame.Color(2, 2, 2)
+_HALF_ALPHA = pygame.Color(2, 2, 2, 1)
+
+# label position -> (label anchor, slider anchor) on the element rect
+_ANCHOR_TABLE: dict[str, tuple[str, str]] = {
+    "left": ("midleft", "midright"),
+    "right": ("midright", "midleft"),
+    "top": ("midtop", "midbottom"),
+    "bottom": ("midbottom", "midtop"),
+}
+
+
+class EventBatch:
+    """
+    Classifies a frame's events once so each element doesn't rescan the whole
+    list. Iterating the batch yields the original events.
+    """
+
+    __slots__ = (
+        "events",
+        "quit",
+        "lmb_down",
+        "lmb_up",
+        "motion",
+        "wheel",
+        "keydown",
+        "mouse_pos",
+        "mouse_pressed",
+    )
+
+    def __init__(self, events: list[Event]) -> None:
+        self.events = events
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pressed = pygame.mouse.get_pressed()
+        self.quit = False
+        self.lmb_down = False
+        self.lmb_up = False
+        self.motion = False
+        self.wheel: list[Event] = []
+        self.keydown: list[Event] = []
+        for event in events:
+            match event.type:
+                case pygame.QUIT:
+                    self.quit = True
+                case pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1:
+                        self.lmb_down = True
+                case pygame.MOUSEBUTTONUP:
+                    self.lmb_up = True
+                case pygame.MOUSEMOTION:
+                    self.motion = True
+                case pygame.MOUSEWHEEL:
+                    self.wheel.append(event)
+                case pygame.KEYDOWN:
+                    self.keydown.append(event)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    @classmethod
+    def of(cls, events: "list[Event] | EventBatch") -> "EventBatch":
+        return events if isinstance(events, EventBatch) else cls(events)
+
+
+def render_all(screen: pygame.Surface, elements: list["Element"]) -> None:
+    """
+    Renders elements through a single batched blit call. Elements that draw
+    themselves (no blit pair) fall back to their own render.
+    """
+    blit_pairs = []
+    for element in elements:
+        pair = element.get_blit_pair()
+        if pair is None:
+            element.render(screen)
+        else:
+            blit_pairs.append(pair)
+    if blit_pairs:
+        _batch_blit(screen, blit_pairs)
+
 
 class Element(ABC):
     rect: pygame.Rect
@@ -18,28 +101,51 @@ class Element(ABC):
     surface: pygame.Surface
     on_click: Callable[[], None]
 
+    # set by state setters, cleared once the element recomposes its surface
+    _dirty: bool = True
+
     @abstractmethod
     def __init__(self) -> None:
         pass
 
+    def mark_dirty(self) -> None:
+        """Forces the element to recompose its surface on the next draw."""
+        self._dirty = True
+
     @abstractmethod
     def render(self, surface: pygame.Surface) -> None:
         pass
 
     @abstractmethod
-    def update(self, events: list[pygame.event.Event]) -> None:
+    def update(self, events: list[pygame.event.Event] | EventBatch) -> None:
         """
         Updates the element properties. Ususally implemented with is_input_recieved.
         """
         pass
 
-    def click(self, events: list[pygame.event.Event]) -> bool:
+    def click(self, events: list[pygame.event.Event] | EventBatch) -> bool:
         return False
 
-    def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+    def get_blit_pair(self) -> tuple[pygame.Surface, pygame.Rect] | None:
+        """
+        Returns the (surface, rect) pair to draw for this element, or None
+        when the element draws itself in render.
+        """
+        return None
+
+    def is_input_recieved(self, mouse_position: tuple[int, int] | None = None) -> bool:
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
         return not self.disabled and self.rect.collidepoint(mouse_position)
 
+    def hover_rect(self) -> pygame.Rect | None:
+        """
+        The rect a hover test should use, or None when the element can't be
+        hovered right now. Mirrors is_input_recieved, but lets callers batch
+        several elements into one collidelist call.
+        """
+        return None if self.disabled else self.rect
+
     @property
     def position(self):
         return self._position
@@ -71,56 +177,84 @@ class ButtonElement(Element):
         self.disabled = False
         self._font = font
         self._base_color = base_color
+        self._disabled_color = base_color // _HALF
         self._hovering_color = hovering_color
+        self._text_cache: dict[tuple[bool, bool], pygame.Surface] = {}
         self.text_input = text_input
         self._outline_size = outline_size
         self._outline_color = outline_color
         if font is not None:
-            self._toggle_text_color(self._base_color)
+            self._toggle_text_color(False)
         self.image = image
         self.surface = image if image is not None else self.surface
         self.position = position
         self.on_click = on_click
         self.sound = sound
+        if sound is None:
+            # specialize the hot path: no sound branch when there is no sound
+            self.click = self._click_silent
 
-    def click(self, events: list[pygame.event.Event]):
-        if (
-            not any(
-                event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-                for event in events
-            )
-            or not self.is_input_recieved()
-        ):
+    def click(self, events: list[pygame.event.Event] | EventBatch):
+        batch = EventBatch.of(events)
+        if not batch.lmb_down or not self.is_input_recieved(batch.mouse_pos):
+            return False
+
+        self.sound.play()
+        self.on_click()
+        return True
+
+    def _click_silent(self, events: list[pygame.event.Event] | EventBatch):
+        batch = EventBatch.of(events)
+        if not batch.lmb_down or not self.is_input_recieved(batch.mouse_pos):
             return False
 
-        if self.sound:
-            self.sound.play()
         self.on_click()
         return True
 
     def render(self, screen: pygame.Surface) -> None:
         screen.blit(self.surface, self.rect)
 
-    def _toggle_text_color(self, color: pygame.Color):
+    def get_blit_pair(self) -> tuple[pygame.Surface, pygame.Rect]:
+        return self.surface, self.rect
 
-        disabled_color = self._base_color // pygame.Color(2, 2, 2)
-        color = color if not self.disabled else disabled_color
+    @property
+    def text_input(self):
+        return self._text_input
+
+    @text_input.setter
+    def text_input(self, text_input: str):
+        self._text_input = text_input
+        self._invalidate_text_cache()
+
+    def _invalidate_text_cache(self):
+        self._text_cache.clear()
+
+    def _toggle_text_color(self, is_hovering: bool):
+        key = (self.disabled, is_hovering)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            color = self._hovering_color if is_hovering else self._base_color
+            color = color if not self.disabled else self._disabled_color
+
+            if self._outline_size > 0:
+                surface = OutlineText.get_surface(
+                    text=self.text_input,
+                    font=self._font,
+                    text_color=color,
+                    outline_color=self._outline_color,
+                    outline_width=self._outline_size,
+                )
+            else:
+                surface = self._font.render(self.text_input, True, color)
+            self._text_cache[key] = surface
 
-        if self._outline_size > 0:
-            self.surface = OutlineText.get_surface(
-                text=self.text_input,
-                font=self._font,
-                text_color=color,
-                outline_color=self._outline_color,
-                outline_width=self._outline_size,
-            )
-        else:
-            self.surface = self._font.render(self.text_input, True, color)
+        self.surface = surface
 
-    def update(self, events: list[pygame.event.Event]) -> None:
-        color = self._hovering_color if self.is_input_recieved() else self._base_color
+    def update(self, events: list[pygame.event.Event] | EventBatch) -> None:
         if self._font is not None:
-            self._toggle_text_color(color)
+            self._toggle_text_color(
+                self.is_input_recieved(EventBatch.of(events).mouse_pos)
+            )
 
 
 class BetterButtonElement(ButtonElement):
@@ -147,6 +281,8 @@ class BetterButtonElement(ButtonElement):
             raise Exception("Either image or font must be not None")
 
         self._border_radius = border_radius
+        self._composed_state: tuple | None = None
+        self._surface_rect: pygame.Rect | None = None
         self.disabled = False
         self.text_color = text_color
         self.text_outline_color = text_outline_color
@@ -154,14 +290,22 @@ class BetterButtonElement(ButtonElement):
         self._font = font
         self.base_color = base_color
         self.hovering_color = hovering_color
+        self._text_cache = {}
         self.text_input = text_input
         self._outline_size = outline_size
         self.outline_color = outline_color
+        self._disabled_base_color = base_color // _HALF_ALPHA
+        self._disabled_outline_color = outline_color // _HALF_ALPHA
+        self._disabled_text_color = text_color // _HALF_ALPHA
+        self._disabled_text_outline_color = text_outline_color // _HALF_ALPHA
         self.image = image
         self.sound = sound
+        if sound is None:
+            self.click = self._click_silent
+
+        self._toggle_color(False)
 
         if image is None:
-            self._toggle_color(False)
             text_rect = self._text.get_rect(center=(0, 0))
             size = (
                 (text_rect.width + padding + font.get_height() / 3),
@@ -182,70 +326,113 @@ class BetterButtonElement(ButtonElement):
         else:
             self._image_rect = image.get_rect(center=self._surface_rect.center)
 
-        self.on_click = on_click
-
-    def render(self, screen: pygame.Surface) -> None:
-        br = (
+        self._br = (
             self._border_radius
             if self._border_radius is not None
             else math.floor(self.rect.height / 4)
         )
+        self._compose()
+        self._composed_state = self._current_state(False)
+
+        self.on_click = on_click
+
+    @property
+    def image(self):
+        return self._image
+
+    @image.setter
+    def image(self, image: pygame.Surface | None):
+        self._image = image
+        self._composed_state = None
+        if image is not None and self._surface_rect is not None:
+            self._image_rect = image.get_rect(center=self._surface_rect.center)
+
+    def _invalidate_text_cache(self):
+        self._text_cache.clear()
+        self._composed_state = None
+
+    def _compose(self):
+        """Bakes fill, outline and text/image into self.surface once per state change."""
+        self.surface.fill((0, 0, 0, 0))
         pygame.draw.rect(
             surface=self.surface,
             color=self._displayed_color,
             rect=self._surface_rect,
-            border_radius=br,
+            border_radius=self._br,
         )
         pygame.draw.rect(
             surface=self.surface,
             color=self._displayed_outline_color,
             rect=self._surface_rect,
             width=self._outline_size,
-            border_radius=br,
+            border_radius=self._br,
         )
         if self.image is None:
             self.surface.blit(self._text, self._text_rect)
         else:
             self.surface.blit(self.image, self._image_rect)
 
-        screen.blit(self.surface, self.rect)
-
     def _toggle_color(self, is_hovering: bool):
-        disabled_color = self.base_color // pygame.Color(2, 2, 2, 1)
-        disabled_outline_color = self.outline_color // pygame.Color(2, 2, 2, 1)
-        disabled_text_color = self.text_color // pygame.Color(2, 2, 2, 1)
-        disabled_text_outline_color = self.text_outline_color // pygame.Color(
-            2, 2, 2, 1
-        )
-
         color = self.hovering_color if is_hovering else self.base_color
-        self._displayed_color = color if not self.disabled else disabled_color
+        self._displayed_color = color if not self.disabled else self._disabled_base_color
         self._displayed_outline_color = (
-            self.outline_color if not self.disabled else disabled_outline_color
+            self.outline_color if not self.disabled else self._disabled_outline_color
         )
 
         if self._font is None:
             return
 
-        text_color = self.text_color if not self.disabled else disabled_text_color
-        text_outline_color = (
-            self.text_outline_color
-            if not self.disabled
-            else disabled_text_outline_color
-        )
-        if self.text_outline_size > 0:
-            self._text = OutlineText.get_surface(
-                text=self.text_input,
-                font=self._font,
-                text_color=text_color,
-                outline_color=text_outline_color,
-                outline_width=self.text_outline_size,
+        # the text surface only depends on the disabled state, not on hover
+        text = self._text_cache.get(self.disabled)
+        if text is None:
+            text_color = (
+                self.text_color if not self.disabled else self._disabled_text_color
             )
-        else:
-            self._text = self._font.render(self.text_input, True, text_color)
+            text_outline_color = (
+                self.text_outline_color
+                if not self.disabled
+                else self._disabled_text_outline_color
+            )
+            if self.text_outline_size > 0:
+                text = OutlineText.get_surface(
+                    text=self.text_input,
+                    font=self._font,
+                    text_color=text_color,
+                    outline_color=text_outline_color,
+                    outline_width=self.text_outline_size,
+                )
+            else:
+                text = self._font.render(self.text_input, True, text_color)
+            self._text_cache[self.disabled] = text
+
+        self._text = text
+
+    def _current_state(self, is_hovering: bool) -> tuple:
+        # colors are snapshotted as tuples so in-place mutation is caught too
+        return (
+            is_hovering,
+            self.disabled,
+            self.text_input,
+            tuple(self.base_color),
+            tuple(self.hovering_color),
+            tuple(self.outline_color),
+        )
+
+    def update(self, events: list[pygame.event.Event] | EventBatch) -> None:
+        state = self._current_state(
+            self.is_input_recieved(EventBatch.of(events).mouse_pos)
+        )
+        if state == self._composed_state:
+            return
 
-    def update(self, events: list[pygame.event.Event]) -> None:
-        self._toggle_color(self.is_input_recieved())
+        if self._composed_state is not None and state[3:] != self._composed_state[3:]:
+            # a fill color was reassigned; refresh its disabled variant
+            self._disabled_base_color = self.base_color // _HALF_ALPHA
+            self._disabled_outline_color = self.outline_color // _HALF_ALPHA
+
+        self._composed_state = state
+        self._toggle_color(state[0])
+        self._compose()
 
 
 class TrackButtonElement(Element):
@@ -268,6 +455,9 @@ class TrackButtonElement(Element):
         self.highlighted = False
         self.surface = surface
         self.surface_rect = surface_rect
+        # self.rect is in surface space; this is the same area in screen
+        # space, precomputed so hit testing is a single collidepoint
+        self.hit_rect = rect.move(surface_rect.left, -surface_rect.top)
         self.disabled = False
         self.on_click = on_click
 
@@ -294,14 +484,13 @@ class TrackButtonElement(Element):
     def update(self, events: list[Event]) -> None:
         return super().update(events)
 
-    def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+    def is_input_recieved(self, mouse_position: tuple[int, int] | None = None) -> bool:
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
+        return self.hit_rect.collidepoint(mouse_position)
 
-        return mouse_position[0] - self.surface_rect.left in range(
-            self.rect.left, self.rect.right
-        ) and mouse_position[1] + self.surface_rect.top in range(
-            self.rect.top, self.rect.bottom
-        )
+    def hover_rect(self) -> pygame.Rect | None:
+        return self.hit_rect
 
 
 class SliderElement(Element):
@@ -330,12 +519,19 @@ class SliderElement(Element):
         self.on_value_change: Callable[[float, str], None] = on_value_changed
         self.min: float = min_value
         self.max: float = max_value
+        self._range = max_value - min_value
+        self._inv_range = 1.0 / self._range if self._range else 0.0
+        self._wheel_step = step if step else self._range / 100
         self.sound = sound
+        if sound is None:
+            self.click = self._click_silent
         self._value: float = default_value if default_value is not None else min_value
         self.knob_size = knob_size
         self.slider_height = max(knob_size[1], slider_size[1])
         self.knob_color = knob_color
         self.slider_size = slider_size
+        self._value_font = get_font(slider_size[1] - 3)
+        self._value_surface_cache: dict[int, pygame.Surface] = {}
         self.disabled = False
         self.show_value = show_value
         self.drag = False
@@ -343,6 +539,12 @@ class SliderElement(Element):
         self._label_position = label_position
         self._position = position
         
+        self._knob_surface = pygame.Surface(knob_size)
+        self._knob_surface.fill(knob_color)
+        pygame.draw.rect(
+            self._knob_surface, pygame.Color("black"), (0, 0) + knob_size, width=2
+        )
+
         if type(slider_surface) is pygame.Surface:
             self.slider_surface = pygame.transform.scale(slider_surface, slider_size)
         else:
@@ -367,73 +569,89 @@ class SliderElement(Element):
         self.slider_color = slider_color
     
     def render(self, surface: pygame.Surface) -> None:
+        surface.blit(*self.get_blit_pair())
+
+    def _compose(self):
         if self.show_value:
             self._render_value()
-        surface.blit(self.slider_surface, self._slider_rect)
-        surface.blit(self.label, self._label_rect)
+        surface = self._composed_surface
+        surface.fill((0, 0, 0, 0))
+        offset = (-self._render_rect.left, -self._render_rect.top)
+        surface.blit(self.slider_surface, self._slider_rect.move(offset))
+        surface.blit(self.label, self._label_rect.move(offset))
         # render knob based on value
-        knob_surface = pygame.Surface(size=self.knob_size)
         knob_center = self._value_to_position(self._value)
-        knob_rect = knob_surface.get_rect(center=knob_center)
-        pygame.draw.rect(surface, self.knob_color, knob_rect)
-        pygame.draw.rect(surface, pygame.Color("black"), knob_rect, width=2)
+        knob_rect = self._knob_surface.get_rect(center=knob_center).move(offset)
+        surface.blit(self._knob_surface, knob_rect)
+        self._dirty = False
 
-    def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+    def get_blit_pair(self) -> tuple[pygame.Surface, pygame.Rect]:
+        if self._dirty:
+            self._compose()
+        return self._composed_surface, self._render_rect
+
+    def is_input_recieved(self, mouse_position: tuple[int, int] | None = None) -> bool:
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
         return not self.disabled and self._slider_rect.collidepoint(mouse_position)
 
-    def click(self, events: list[pygame.event.Event]):
-        if not self.is_input_recieved() or not any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def hover_rect(self) -> pygame.Rect | None:
+        return None if self.disabled else self._slider_rect
+
+    def click(self, events: list[pygame.event.Event] | EventBatch):
+        batch = EventBatch.of(events)
+        if not self.is_input_recieved(batch.mouse_pos) or not batch.lmb_down:
             return False
 
-        mouse_position = pygame.mouse.get_pos()
-        self.value = self._position_to_value(mouse_position)
+        self.value = self._position_to_value(batch.mouse_pos)
         self.drag = True
-        if self.sound:
-            self.sound.play()
+        self.sound.play()
         return True
 
-    def update(self, events: list[pygame.event.Event]) -> None:
-        if not self.is_input_recieved():
-            if any(event.type == pygame.MOUSEBUTTONUP for event in events):
+    def _click_silent(self, events: list[pygame.event.Event] | EventBatch):
+        batch = EventBatch.of(events)
+        if not self.is_input_recieved(batch.mouse_pos) or not batch.lmb_down:
+            return False
+
+        self.value = self._position_to_value(batch.mouse_pos)
+        self.drag = True
+        return True
+
+    def update(self, events: list[pygame.event.Event] | EventBatch) -> None:
+        batch = EventBatch.of(events)
+        if not self.is_input_recieved(batch.mouse_pos):
+            if batch.lmb_up:
                 self.drag = False
             return
 
-        if (
-            pygame.mouse.get_pressed()[0]
-            and self.drag
-            and any(event.type == pygame.MOUSEMOTION for event in events)
-        ):
-            mouse_position = pygame.mouse.get_pos()
-            self.value = self._position_to_value(mouse_position)
+        if batch.mouse_pressed[0] and self.drag and batch.motion:
+            self.value = self._position_to_value(batch.mouse_pos)
             return
 
-        mwevents = [event for event in events if event.type == pygame.MOUSEWHEEL]
-        for event in mwevents:
-            self.value = (
-                self.value
-                + (self.step if self.step else ((self.max - self.min) / 100)) * event.y
-            )
+        for event in batch.wheel:
+            self.value = self.value + self._wheel_step * event.y
 
     def render_tooltip(self):
         pass
 
     def _value_to_position(self, value: float):
-        ratio = (value - self.min) / (self.max - self.min)
+        ratio = (value - self.min) * self._inv_range
         centerx = ratio * self._slider_rect.width + self._slider_rect.left
         return (centerx, self._slider_rect.centery)
 
     def _position_to_value(self, mouse_position: tuple[int, int]):
         ratio = (mouse_position[0] - self._slider_rect.left) / self._slider_rect.width
-        return ratio * (self.max - self.min) + self.min
+        return ratio * self._range + self.min
 
     def _render_value(self):
-        value_surface = get_font(self.slider_size[1] - 3).render(
-            f"{round(self.value)}", True, "white"
-        )
+        value = round(self.value)
+        value_surface = self._value_surface_cache.get(value)
+        if value_surface is None:
+            # integer slider ranges are bounded, so this rarely overflows
+            if len(self._value_surface_cache) >= 256:
+                self._value_surface_cache.clear()
+            value_surface = self._value_font.render(f"{value}", True, "white")
+            self._value_surface_cache[value] = value_surface
         value_rect = value_surface.get_rect(topleft=(4, 0))
         self.slider_surface.blit(value_surface, value_rect)
 
@@ -451,6 +669,8 @@ class SliderElement(Element):
         if self.step:
             new_value = round(new_value / self.step) * self.step
         self.on_value_change(new_value, self.id)
+        if new_value != self._value:
+            self.mark_dirty()
         self._value = new_value
 
     @property
@@ -466,33 +686,31 @@ class SliderElement(Element):
             case "left" | "right":
                 width = self.slider_size[0] + self.label_padding + label_size[0]
                 height = max(self.slider_size[1], label_size[1])
-                self.rect = pygame.Surface((width, height)).get_rect(**self.position.dump())
             case "top" | "bottom":
                 width = max(self.slider_size[0], label_size[0])
                 height = self.slider_size[1] + self.label_padding + label_size[1]
-                self.rect = pygame.Surface((width, height)).get_rect(**self.position.dump())
-        
-        match label_position:
-            case "left":
-                self._label_rect = self.label.get_rect(midleft=self.rect.midleft)
-                self._slider_rect = self.slider_surface.get_rect(
-                    midright=self.rect.midright
-                )
-            case "right":
-                self._label_rect = self.label.get_rect(midright=self.rect.midright)
-                self._slider_rect = self.slider_surface.get_rect(
-                    midleft=self.rect.midleft
-                )
-            case "top":
-                self._label_rect = self.label.get_rect(midtop=self.rect.midtop)
-                self._slider_rect = self.slider_surface.get_rect(
-                    midbottom=self.rect.midbottom
-                )
-            case "bottom":
-                self._label_rect = self.label.get_rect(midbottom=self.rect.midbottom)
-                self._slider_rect = self.slider_surface.get_rect(
-                    midtop=self.rect.midtop
-                )
+
+        # a plain Rect anchored at the position, without allocating a
+        # throwaway Surface just to call get_rect on it
+        self.rect = pygame.Rect(0, 0, width, height)
+        setattr(self.rect, self.position.anchor, self.position.coords)
+
+        # inflated so the knob is never clipped when it overhangs the rect
+        self._render_rect = self.rect.inflate(self.knob_size[0], self.knob_size[1])
+        self._composed_surface = pygame.Surface(
+            self._render_rect.size, flags=pygame.SRCALPHA, depth=32
+        )
+        self._composed_surface.convert_alpha()
+
+        label_anchor, slider_anchor = _ANCHOR_TABLE[label_position]
+        self._label_rect = self.label.get_rect(
+            **{label_anchor: getattr(self.rect, label_anchor)}
+        )
+        self._slider_rect = self.slider_surface.get_rect(
+            **{slider_anchor: getattr(self.rect, slider_anchor)}
+        )
+
+        self.mark_dirty()
 
 
 class TextFieldElement(Element):
@@ -519,65 +737,114 @@ class TextFieldElement(Element):
         self.surface.convert_alpha()
         self.surface_rect = self.surface.get_rect(topleft=(0, 0))
         self.rect = self.surface.get_rect(**position.dump())
-        self.max_text_rect = pygame.Surface((width, font.get_height())).get_rect(
-            center=self.surface_rect.center
-        )
+        self.max_text_rect = pygame.Rect(0, 0, width, font.get_height())
+        self.max_text_rect.center = self.surface_rect.center
+        self._fill_radius = math.floor(self.surface_rect.height / 5)
+        self._border_radius = math.floor(self.surface_rect.height / 8)
+        self._border_width = math.floor(self.surface_rect.height / 12)
         self.value = default
         self.text_align = text_align
         self.on_enter = on_enter
         self.on_value_changed = on_value_changed
 
-    def is_input_recieved(self) -> bool:
-        mouse_pos = pygame.mouse.get_pos()
-        return self.rect.collidepoint(mouse_pos)
+    @property
+    def value(self):
+        return self._value
 
-    def update(self, events: list[Event]) -> None:
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                self.disabled = not self.is_input_recieved()
-
-            if event.type != pygame.KEYDOWN or self.disabled:
-                continue
-
-            match event.key:
-                case pygame.K_BACKSPACE:
-                    # get text input from 0 to -1 i.e. end.
-                    self.value = self.value[:-1]
-                case pygame.K_RETURN | pygame.K_KP_ENTER:
-                    self.on_enter()
-                case pygame.K_ESCAPE:
-                    self.disabled = True
-                case _:
-                    # Unicode standard is used for string formation
-                    self.value += event.unicode
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+        self.mark_dirty()
+
+    @property
+    def disabled(self):
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, disabled: bool):
+        self._disabled = disabled
+        self.mark_dirty()
+
+    @property
+    def text_align(self):
+        return self._text_align
+
+    @text_align.setter
+    def text_align(self, text_align: Literal["right", "left", "center"]):
+        self._text_align = text_align
+        self.mark_dirty()
+
+    def is_input_recieved(self, mouse_position: tuple[int, int] | None = None) -> bool:
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
+        return self.rect.collidepoint(mouse_position)
+
+    def hover_rect(self) -> pygame.Rect | None:
+        # an unfocused (disabled) text field is still clickable
+        return self.rect
+
+    def update(self, events: list[Event] | EventBatch) -> None:
+        batch = EventBatch.of(events)
+        if batch.lmb_down:
+            self.disabled = not self.is_input_recieved(batch.mouse_pos)
+
+        if not self.disabled:
+            for event in batch.keydown:
+                if self.disabled:
+                    break
+                match event.key:
+                    case pygame.K_BACKSPACE:
+                        # get text input from 0 to -1 i.e. end.
+                        self.value = self.value[:-1]
+                    case pygame.K_RETURN | pygame.K_KP_ENTER:
+                        self.on_enter()
+                    case pygame.K_ESCAPE:
+                        self.disabled = True
+                    case _:
+                        # Unicode standard is used for string formation
+                        self.value += event.unicode
 
         self.on_value_changed(self.value)
 
-    def click(self, events: list[pygame.event.Event]):
-        if self.is_input_recieved() and any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def click(self, events: list[pygame.event.Event] | EventBatch):
+        batch = EventBatch.of(events)
+        if not batch.lmb_down:
+            return False
+
+        if self.is_input_recieved(batch.mouse_pos):
             if self.sound:
                 self.sound.play()
             self.disabled = False
             return True
-        elif not self.is_input_recieved() and any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
-            self.disabled = True
 
+        self.disabled = True
         return False
 
-    def render(self, surface: pygame.Surface) -> None:
-        text_to_render = self.value
-        long = False
-        while self.font.size("..." + text_to_render)[0] > self.max_text_rect.width:
-            text_to_render = text_to_render[1:]
-            long = True
-        if long:
-            text_to_render = "..." + text_to_render
+    def _fit_text(self) -> str:
+        """
+        Fits the value into the text rect, replacing the overflowing head with
+        an ellipsis. Binary-searches the longest suffix that still fits, so
+        only O(log n) font.size calls are needed instead of one per character.
+        """
+        text = self.value
+        max_width = self.max_text_rect.width
+        if self.font.size("..." + text)[0] <= max_width:
+            return text
+
+        length = len(text)
+        best = 0
+        low, high = 0, length - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if self.font.size("..." + text[length - mid :])[0] <= max_width:
+                best = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return "..." + text[length - best :]
+
+    def _compose(self):
+        text_to_render = self._fit_text()
 
         TEXT = self.font.render(text_to_render, True, "black")
         TEXT_RECT = TEXT.get_rect(midleft=self.max_text_rect.midleft)
@@ -592,18 +859,25 @@ class TextFieldElement(Element):
             ("gray" if self.disabled else "white"),
             self.surface_rect,
             0,
-            math.floor(self.surface_rect.height / 5),
+            self._fill_radius,
         )
         pygame.draw.rect(
             self.surface,
             "black",
             self.surface_rect,
-            math.floor(self.surface_rect.height / 12),
-            math.floor(self.surface_rect.height / 8),
+            self._border_width,
+            self._border_radius,
         )
         self.surface.blit(TEXT, TEXT_RECT)
+        self._dirty = False
 
-        surface.blit(self.surface, self.rect)
+    def get_blit_pair(self) -> tuple[pygame.Surface, pygame.Rect]:
+        if self._dirty:
+            self._compose()
+        return self.surface, self.rect
+
+    def render(self, surface: pygame.Surface) -> None:
+        surface.blit(*self.get_blit_pair())
 
 
 class TimerElement(Element):
@@ -628,6 +902,9 @@ class TimerElement(Element):
         self._threshold_color = threshold_color
         self._current_time: float = 0
         self.on_done = on_done
+        self._last_format_key: int | None = None
+        self._last_text = ""
+        self._surface_cache: dict[tuple[str, bool], pygame.Surface] = {}
         self.surface = self._get_timer_surface(self.format_timer(0, timer_type))
         self.rect = self.surface.get_rect(**position.dump())
         self.disabled = True
@@ -683,13 +960,30 @@ class TimerElement(Element):
         )
 
     def render(self, surface: pygame.Surface) -> None:
-        text = self.format_timer(timer=self.timer, type=self._type)
-
-        self.surface = self._get_timer_surface(text)
-
-        self.rect = self.surface.get_rect(**self._position.dump())
-
-        surface.blit(self.surface, self.rect)
+        surface.blit(*self.get_blit_pair())
+
+    def get_blit_pair(self) -> tuple[pygame.Surface, pygame.Rect]:
+        # the formatted text only changes once per (rounded) second, so skip
+        # strftime on the ~59 frames in between
+        format_key = round(self.timer) if self._type == "sec" else int(self.timer)
+        if format_key != self._last_format_key:
+            self._last_format_key = format_key
+            self._last_text = self.format_timer(timer=self.timer, type=self._type)
+        text = self._last_text
+        key = (text, self.timer <= self._threshold)
+
+        cached = self._surface_cache.get(key)
+        if cached is None:
+            if len(self._surface_cache) >= 128:
+                self._surface_cache.pop(next(iter(self._surface_cache)))
+            cached = self._get_timer_surface(text)
+            self._surface_cache[key] = cached
+
+        if cached is not self.surface:
+            self.surface = cached
+            self.rect = self.surface.get_rect(**self._position.dump())
+
+        return self.surface, self.rect
 
     @property
     def timer(self):
@@ -17,6 +17,9 @@ class GraphicsManager:
     tracks: list[TrackButtonElement]
     home_tracks: dict[Player, TrackButtonElement]
 
+    # tag returned by check_board_input for the home track (tracks are 0-23)
+    HOME_INDEX = 24
+
     RECT: pygame.Rect
 
     def __init__(
@@ -99,8 +102,24 @@ class GraphicsManager:
         self.bottom_tracks_rect = []
         self.tracks = []
 
+        self._dice_center = (
+            math.floor((self.RECT.right + self.screen.get_width()) / 2),
+            560,
+        )
+        self._last_dice: tuple[int, int] | None = None
+        self._dice_surface: pygame.Surface | None = None
+        self._dice_rect: pygame.Rect | None = None
+        self._board_key: tuple | None = None
+
         self.create_tracks_rects()
         self.create_home_tracks()
+        self._track_hit_rects = [track.hit_rect for track in self.tracks]
+        # one hit list per player: the 24 tracks plus that player's home
+        # track, so a click resolves with a single collidelist
+        self._board_hit_rects = {
+            player: self._track_hit_rects + [home_track.hit_rect]
+            for player, home_track in self.home_tracks.items()
+        }
 
     def create_home_tracks(self) -> None:
         self.home_tracks = {
@@ -139,20 +158,20 @@ class GraphicsManager:
             else:
                 button.highlighted = False
 
-    def check_track_input(self) -> int:
+    def check_board_input(self, player: Player) -> int:
         """
-        Returns the index of hoverd track.
-        If no track was clicked, -1 is returned
+        Returns the highlighted board area under the mouse: a track index,
+        HOME_INDEX for the given player's home track, or -1 for neither.
         """
-        for index, button in enumerate(self.tracks):
-            if button.is_input_recieved() and button.highlighted:
-                return index
+        index = pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelist(
+            self._board_hit_rects[player]
+        )
+        if index == self.HOME_INDEX:
+            return index if self.home_tracks[player].highlighted else -1
+        if index != -1 and self.tracks[index].highlighted:
+            return index
         return -1
 
-    def check_home_track_input(self, player: Player) -> bool:
-        button = self.home_tracks[player]
-        return button.is_input_recieved() and button.highlighted
-
     def create_tracks_rects(self) -> None:
 
         # top left RECT
@@ -231,35 +250,53 @@ class GraphicsManager:
         dice = game_state.dice
         current_turn = game_state.current_turn
 
-        # whole board + home
-        self.surface.fill("brown")
-        side_color = pygame.Color(246, 224, 135)
-        pygame.draw.rect(self.surface, "black", (0, 0) + self.RECT.size, 2)
+        # everything drawn on self.surface is determined by this key; skip
+        # the redraw and just re-blit while it is unchanged
+        key = (
+            tuple(board),
+            bar[Player.player1],
+            bar[Player.player2],
+            home[Player.player1],
+            home[Player.player2],
+            tuple(player_colors[Player.player1]),
+            tuple(player_colors[Player.player2]),
+            tuple(button.highlighted for button in self.tracks),
+            self.home_tracks[Player.player1].highlighted,
+            self.home_tracks[Player.player2].highlighted,
+        )
+        if key != self._board_key:
+            self._board_key = key
 
-        # left side
-        pygame.draw.rect(self.surface, side_color, self._LEFT_SIDE_RECT)
-        pygame.draw.rect(self.surface, "black", self._LEFT_SIDE_RECT, 2)
+            # whole board + home
+            self.surface.fill("brown")
+            side_color = pygame.Color(246, 224, 135)
+            pygame.draw.rect(self.surface, "black", (0, 0) + self.RECT.size, 2)
 
-        # right side
-        pygame.draw.rect(self.surface, side_color, self._RIGHT_SIDE_RECT)
-        pygame.draw.rect(
-            self.surface,
-            "black",
-            self._RIGHT_SIDE_RECT,
-            2,
-        )
+            # left side
+            pygame.draw.rect(self.surface, side_color, self._LEFT_SIDE_RECT)
+            pygame.draw.rect(self.surface, "black", self._LEFT_SIDE_RECT, 2)
+
+            # right side
+            pygame.draw.rect(self.surface, side_color, self._RIGHT_SIDE_RECT)
+            pygame.draw.rect(
+                self.surface,
+                "black",
+                self._RIGHT_SIDE_RECT,
+                2,
+            )
 
-        for button in self.tracks:
-            button.render()
+            for button in self.tracks:
+                button.render()
 
-        self.render_tracks()
+            self.render_tracks()
 
-        self.render_pieces(board=board, player_colors=player_colors)
+            self.render_pieces(board=board, player_colors=player_colors)
 
-        self.render_bar_pieces(bar=bar, player_colors=player_colors)
+            self.render_bar_pieces(bar=bar, player_colors=player_colors)
 
-        self.render_home(home=home, player_colors=player_colors)
+            self.render_home(home=home, player_colors=player_colors)
 
+        # these draw straight onto the screen, which is repainted each frame
         self.render_dice(dice=dice)
 
         self.render_score(score=score, player_colors=player_colors)
@@ -292,19 +329,17 @@ class GraphicsManager:
         )
 
     def render_dice(self, dice: tuple[int, int]):
-        OutlineText.render(
-            text=str(dice[0]) + " " + str(dice[1]),
-            font=get_font(70),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            position=Position(
-                coords=(
-                    math.floor((self.RECT.right + self.screen.get_width()) / 2),
-                    560,
-                )
-            ),
-            surface=self.screen,
-        )
+        # the dice only change between turns, so keep the rendered surface
+        if dice != self._last_dice:
+            self._last_dice = dice
+            self._dice_surface = OutlineText.get_surface(
+                text=str(dice[0]) + " " + str(dice[1]),
+                font=get_font(70),
+                text_color=pygame.Color("white"),
+                outline_color=pygame.Color("black"),
+            )
+            self._dice_rect = self._dice_surface.get_rect(center=self._dice_center)
+        self.screen.blit(self._dice_surface, self._dice_rect)
 
     def render_score(
         self, score: dict[Player, int], player_colors: dict[Player, pygame.Color]
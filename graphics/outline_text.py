@@ -5,6 +5,8 @@ from models import Position
 
 class OutlineText:
     _circle_cache: dict[int, list[tuple[int, int]]] = {}
+    _surface_cache: dict[tuple, pygame.Surface] = {}
+    _SURFACE_CACHE_SIZE = 256
 
     def __init__(
         self,
@@ -52,21 +54,39 @@ class OutlineText:
         outline_color: pygame.Color = pygame.Color(255, 255, 255),
         outline_width: int = 2,
     ) -> pygame.Surface:
+        key = (
+            text,
+            font,
+            tuple(pygame.Color(text_color)),
+            tuple(pygame.Color(outline_color)),
+            outline_width,
+        )
+        cached = cls._surface_cache.get(key)
+        if cached is not None:
+            return cached
+
         textsurface = font.render(text, True, text_color).convert_alpha()
+        outline_surface = font.render(text, True, outline_color).convert_alpha()
         w = textsurface.get_width() + 2 * outline_width
         h = font.get_height()
 
-        osurf = pygame.Surface((w, h + 2 * outline_width)).convert_alpha()
-        osurf.fill((0, 0, 0, 0))
-
-        surf = osurf.copy()
+        surf = pygame.Surface((w, h + 2 * outline_width)).convert_alpha()
+        surf.fill((0, 0, 0, 0))
 
-        osurf.blit(font.render(text, True, outline_color).convert_alpha(), (0, 0))
-
-        for dx, dy in cls._circlepoints(outline_width):
-            surf.blit(osurf, (dx + outline_width, dy + outline_width))
+        # stamp the outline-colored text directly at each circle offset; the
+        # old intermediate full-size surface only ever held this same render
+        surf.blits(
+            [
+                (outline_surface, (dx + outline_width, dy + outline_width))
+                for dx, dy in cls._circlepoints(outline_width)
+            ]
+        )
 
         surf.blit(textsurface, (outline_width, outline_width))
+
+        if len(cls._surface_cache) >= cls._SURFACE_CACHE_SIZE:
+            cls._surface_cache.pop(next(iter(cls._surface_cache)))
+        cls._surface_cache[key] = surf
         return surf
 
     @classmethod
@@ -1,7 +1,11 @@
+import logging
+
 from game_manager import GameManager
 
 
 def main():
+    # keep logger.debug calls in the game/network hot paths free
+    logging.basicConfig(level=logging.WARNING)
     GameManager.start()
     from menus.screens import MainScreen
     MainScreen.start(GameManager.screen, GameManager.clock)
@@ -1,3 +1,4 @@
+import logging
 import time
 from typing import Callable
 from pygame import Surface
@@ -17,6 +18,8 @@ from models import ColorConverter, GameState, Move, MoveType, OnlineGameState, S
 from models import Player
 from network import BGServer, NetworkClient
 
+logger = logging.getLogger(__name__)
+
 
 class BotGame(GameScreen):
 
@@ -34,7 +37,6 @@ class BotGame(GameScreen):
         cls.start_timer()
 
         if not cls.is_my_turn():
-            print("hello")
             cls.setup_bot()
 
         while cls.run:
@@ -47,7 +49,7 @@ class BotGame(GameScreen):
             if cls.bot and time.time() - cls.bot_current_time > 1:
                 cls.move_bot(on_game_over=cls.done_turn)
 
-            events = pygame.event.get()
+            events = cls.get_events()
 
             cls.check_quit(events=events, quit=GameManager.quit)
 
@@ -118,7 +120,7 @@ class BotGame(GameScreen):
             return
 
         cls.backgammon.switch_turn()
-        print(f"is bot turn: {cls.is_my_turn()}")
+        logger.debug("is bot turn: %s", cls.is_my_turn())
         if not cls.is_my_turn():
             cls.setup_bot()
 
@@ -181,7 +183,7 @@ class OfflineGame(GameScreen):
 
             cls.update_game_buttons()
 
-            events = pygame.event.get()
+            events = cls.get_events()
             cls.check_quit(events=events, quit=GameManager.quit)
 
             cls.render_elements(
@@ -322,7 +324,7 @@ class LocalClientGame(GameScreen):
 
             cls.highlight_tracks(is_my_turn=cls.is_my_turn())
 
-            events = pygame.event.get()
+            events = cls.get_events()
 
             cls.check_quit(events=events, quit=cls.quit)
 
@@ -527,7 +529,7 @@ class OnlineClientGame(GameScreen):
             
             cls.highlight_tracks(is_my_turn=cls.is_my_turn())
 
-            events = pygame.event.get()
+            events = cls.get_events()
             
             cls.check_quit(events=events, quit=cls.quit)
 
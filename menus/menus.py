@@ -127,8 +127,8 @@ class OptionsMenu(Menu):
     
     @staticmethod
     def get_volume_button_image():
-        return pygame.transform.scale(
-            config.MUTE_ICON if GameManager.sound_manager.volume == 0 else config.VOLUME_ICON,
+        return config.get_icon(
+            "mute.png" if GameManager.sound_manager.volume == 0 else "volume.png",
             (30, 30),
         )
 
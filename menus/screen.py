@@ -1,4 +1,5 @@
 from enum import StrEnum, auto
+import logging
 import math
 import time
 from backgammon import Backgammon, BackgammonAI
@@ -6,41 +7,87 @@ import config
 from config import get_font
 from decorators import debounce
 from game_manager import GameManager
-from graphics.elements import ButtonElement, Element, TimerElement
+from graphics.elements import (
+    ButtonElement,
+    Element,
+    EventBatch,
+    TimerElement,
+    render_all,
+)
 import pygame
 from typing import Callable
 from graphics.graphics_manager import GraphicsManager
 from graphics.styled_elements import StyledButton
 from models import ColorConverter, Move, Player, Position, ScoredMoves
 
+logger = logging.getLogger(__name__)
+
 
 class Screen:
+    # the only event types any screen reacts to; the rest never need to
+    # become Python objects
+    _HANDLED_EVENT_TYPES = [
+        pygame.QUIT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.KEYDOWN,
+    ]
+
     @classmethod
     def start(cls, screen: pygame.Surface, clock: pygame.time.Clock):
         pass
         raise NotImplementedError()
 
+    @classmethod
+    def get_events(cls) -> EventBatch:
+        """
+        Fetches the frame's relevant events (filtered in C) and classifies
+        them once. Drops whatever else accumulated so the queue can't fill.
+        """
+        events = pygame.event.get(eventtype=cls._HANDLED_EVENT_TYPES)
+        pygame.event.clear()
+        return EventBatch(events)
+
     @classmethod
     def render_elements(
         cls,
         screen: pygame.Surface,
         elements: list[Element],
-        events: list[pygame.event.Event],
+        events: list[pygame.event.Event] | EventBatch,
         update_condition=True,
     ):
-        for element in elements:
-            if update_condition:
+        if update_condition:
+            events = EventBatch.of(events)
+            for element in elements:
                 element.update(events)
-            element.render(screen)
+        render_all(screen, elements)
+
+    @classmethod
+    def _any_hovered(cls, elements: list[Element]):
+        # collect the hoverable rects and run one C-level collidelist
+        # instead of a Python collidepoint per element
+        rects: list[pygame.Rect] = []
+        for element in elements:
+            rect = element.hover_rect()
+            if rect is not None:
+                rects.append(rect)
+        return pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelist(rects) != -1
 
     @classmethod
     def _get_cursor(cls, elements: list[Element], condition=True):
-        if any(button.is_input_recieved() for button in elements) and condition:
+        if condition and cls._any_hovered(elements):
             return pygame.SYSTEM_CURSOR_HAND
         return pygame.SYSTEM_CURSOR_ARROW
 
     @classmethod
-    def click_elements(cls, elements: list[Element], events: list[pygame.event.Event]):
+    def click_elements(
+        cls,
+        elements: list[Element],
+        events: list[pygame.event.Event] | EventBatch,
+    ):
+        events = EventBatch.of(events)
         clicked = False
         for element in elements:
             clicked = element.click(events)
@@ -48,8 +95,12 @@ class Screen:
                 break
 
     @classmethod
-    def check_quit(cls, events: list[pygame.event.Event], quit: Callable[[], None]):
-        if any(event.type == pygame.QUIT for event in events):
+    def check_quit(
+        cls,
+        events: list[pygame.event.Event] | EventBatch,
+        quit: Callable[[], None],
+    ):
+        if EventBatch.of(events).quit:
             quit()
 
 
@@ -79,7 +130,7 @@ class GameScreen(Screen):
     )
 
     options_button = StyledButton(
-        image=config.OPTIONS_ICON,
+        image=config.get_icon("settings.png"),
     )
 
     timer = TimerElement(
@@ -93,7 +144,8 @@ class GameScreen(Screen):
     always_on_buttons = [leave_button, options_button]
     all_elements: list[Element] = game_buttons + always_on_buttons + [timer]
 
-    ai_moves: list[Move]
+    # None while the AI search is still running on its worker thread
+    ai_moves: list[Move] | None
     bot = False
     bot_current_time: float = 0
     backgammon: Backgammon
@@ -102,6 +154,10 @@ class GameScreen(Screen):
     graphics: GraphicsManager
     last_clicked_index = -1
     highlighted_indexes: list[int] = []
+    _game_buttons_key: tuple | None = None
+    _highlight_key: tuple | None = None
+    _cursor_cache: dict[tuple, int] = {}
+    _CURSOR_CACHE_SIZE = 8
 
     @classmethod
     @debounce(0.1)
@@ -125,26 +181,39 @@ class GameScreen(Screen):
         elements: list[ButtonElement],
         condition=True,
     ):
+        # the hover tests below touch every track and element; while the
+        # mouse rests their inputs rarely change, so key the answer on them
+        key = (
+            pygame.mouse.get_pos(),
+            condition,
+            tuple(element.disabled for element in elements),
+            cls._highlight_key,
+        )
+        cached = cls._cursor_cache.get(key)
+        if cached is not None:
+            return cached
 
         if condition and (
-            cls.graphics.check_track_input() != -1
-            or cls.graphics.check_home_track_input(player=cls.backgammon.current_turn)
-            or any(button.is_input_recieved() for button in elements)
+            cls.graphics.check_board_input(player=cls.backgammon.current_turn) != -1
+            or cls._any_hovered(elements)
         ):
-            return pygame.SYSTEM_CURSOR_HAND
-        return pygame.SYSTEM_CURSOR_ARROW
+            cursor = pygame.SYSTEM_CURSOR_HAND
+        else:
+            cursor = pygame.SYSTEM_CURSOR_ARROW
+
+        if len(cls._cursor_cache) >= cls._CURSOR_CACHE_SIZE:
+            cls._cursor_cache.pop(next(iter(cls._cursor_cache)))
+        cls._cursor_cache[key] = cursor
+        return cursor
 
     @classmethod
-    def move_piece(cls, events: list[pygame.event.Event]):
-        if not any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def move_piece(cls, events: list[pygame.event.Event] | EventBatch):
+        if not EventBatch.of(events).lmb_down:
             return
 
-        index = cls.graphics.check_track_input()
+        index = cls.graphics.check_board_input(player=cls.backgammon.current_turn)
 
-        if cls.graphics.check_home_track_input(player=cls.backgammon.current_turn):
+        if index == GraphicsManager.HOME_INDEX:
             cls.on_bear_off()
             cls.play_piece_sound()
         elif index != -1:  # clicked on track
@@ -163,7 +232,7 @@ class GameScreen(Screen):
                     cls.on_normal_move(index)
                     cls.play_piece_sound()
 
-            print(cls.last_clicked_index)
+            logger.debug("last clicked index: %s", cls.last_clicked_index)
         else:  # clicked not on a track
             cls.on_random_click()
 
@@ -172,6 +241,9 @@ class GameScreen(Screen):
         right_center = math.floor((cls.graphics.RECT.right + config.RESOLUTION[0]) / 2)
         left_center = math.floor(cls.graphics.RECT.left / 2)
 
+        cls._game_buttons_key = None
+        cls._highlight_key = None
+        cls._cursor_cache.clear()
         cls.done_button.disabled = True
         cls.done_button.position = Position(
             anchor="midbottom", coords=(right_center, config.SCREEN.centery)
@@ -207,11 +279,13 @@ class GameScreen(Screen):
         if cls.backgammon.is_turn_done():
             cls.ai_moves = []
             return
-        
+
+        cls.ai_moves = None
+
         def save_ai_moves(scored_moves: ScoredMoves):
             cls.ai_moves = scored_moves.moves
-            print(cls.ai_moves)
-            
+            logger.debug("ai moves: %s", cls.ai_moves)
+
         cls.bot_current_time = time.time()
         BackgammonAI.get_best_move(game=cls.backgammon, callback=save_ai_moves)
 
@@ -222,8 +296,11 @@ class GameScreen(Screen):
         on_move: Callable[[Move], None] = lambda x: None,
     ):
         cls.bot_current_time = time.time()
+        if cls.ai_moves is None:
+            # the threaded search hasn't finished yet; check again next tick
+            return
         if len(cls.ai_moves) == 0:
-            print("bot played")
+            logger.debug("bot played")
             cls.bot = False
             if cls.backgammon.is_game_over():
                 on_game_over()
@@ -232,7 +309,7 @@ class GameScreen(Screen):
         else:
             cls.play_piece_sound()
             move = cls.ai_moves.pop()
-            print("Handled Move: ", move)
+            logger.debug("Handled Move: %s", move)
             cls.backgammon.handle_move(move=move)
             on_move(move)
 
@@ -286,6 +363,23 @@ class GameScreen(Screen):
 
     @classmethod
     def highlight_tracks(cls, is_my_turn=True):
+        # recomputing the highlights walks the board, so only do it when
+        # something the result depends on has changed
+        backgammon = cls.backgammon
+        key = (
+            cls.last_clicked_index,
+            tuple(backgammon.board),
+            tuple(backgammon.moves_left),
+            backgammon.get_captured_pieces(),
+            backgammon.current_turn,
+            cls.is_screen_on_top(),
+            cls.bot,
+            is_my_turn,
+        )
+        if key == cls._highlight_key:
+            return
+        cls._highlight_key = key
+
         cls.highlighted_indexes = []
 
         if not cls.is_screen_on_top() and not cls.bot and is_my_turn:
@@ -325,8 +419,24 @@ class GameScreen(Screen):
 
     @classmethod
     def update_game_buttons(cls):
+        # is_turn_done walks the whole board; only recompute when something
+        # it depends on has changed since the last frame
+        backgammon = cls.backgammon
+        key = (
+            tuple(backgammon.board),
+            tuple(backgammon.moves_left),
+            backgammon.get_captured_pieces(),
+            backgammon.current_turn,
+            cls.is_my_turn(),
+            cls.bot,
+            cls.has_history(),
+        )
+        if key == cls._game_buttons_key:
+            return
+        cls._game_buttons_key = key
+
         cls.done_button.disabled = (
-            not cls.backgammon.is_turn_done() or not cls.is_my_turn() or cls.bot
+            not backgammon.is_turn_done() or not cls.is_my_turn() or cls.bot
         )
         cls.undo_button.disabled = (
             not cls.has_history() or not cls.is_my_turn() or cls.bot
@@ -11,141 +11,159 @@ from menus.screen import Screen
 import pygame
 from pygame.time import Clock
 import ipaddress
-import math
 
 from models import Position
 
 class LostConnection(Screen):
 
+    run = True
+
+    lost_connection_text = OutlineText(
+        text="LOST CONNECTION",
+        font=get_font(100),
+        text_color=pygame.Color("white"),
+        outline_color=pygame.Color("black"),
+        position=Position(coords=(config.SCREEN.centerx, 200)),
+    )
+
+    to_the_server_text = OutlineText(
+        text="TO THE SERVER",
+        font=get_font(100),
+        text_color=pygame.Color("white"),
+        outline_color=pygame.Color("black"),
+        position=Position(coords=(config.SCREEN.centerx, 300)),
+    )
+
+    back_button = StyledButton(
+        position=Position(coords=(config.SCREEN.centerx, 650)),
+        text_input="BACK",
+        font=get_font(50),
+    )
+
+    buttons: list[Element] = [back_button]
+
     @classmethod
     def start(cls, screen: pygame.Surface, clock: Clock):
-        run = True
-
-        lost_connection = OutlineText(
-            text="LOST CONNECTION",
-            font=get_font(100),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 200)),
-        )
-        
-        to_the_server = OutlineText(
-            text="TO THE SERVER",
-            font=get_font(100),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 300)),
-        )
-        
+        cls.run = True
+        cls.back_button.on_click = cls.stop
 
-        def back_click():
-            nonlocal run
-            run = False
+        rendered = False
+        while cls.run:
+            clock.tick(config.MENU_FRAMERATE)
 
-        back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="BACK",
-            font=get_font(50),
-            on_click=back_click,
-        )
+            events = cls.get_events()
+            cls.check_quit(events=events, quit=GameManager.quit)
 
-        buttons = [back_button]
+            # static screen: already drawn and nothing happened this frame
+            if rendered and not events.events:
+                continue
 
-        while run:
             GraphicsManager.render_background(screen)
-            clock.tick(config.FRAMERATE)
-
-            lost_connection.update(screen)
-            to_the_server.update(screen)
-            
-            cls.render_elements(screen=screen, elements=buttons)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
-            
-            events = pygame.event.get()
-            
-            cls.check_quit(events=events, quit=GameManager.quit)
-            cls.click_elements(elements=buttons, events=events)
+
+            cls.lost_connection_text.update(screen)
+            cls.to_the_server_text.update(screen)
+
+            cls.render_elements(screen=screen, elements=cls.buttons, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.buttons))
+
+            cls.click_elements(elements=cls.buttons, events=events)
 
             pygame.display.flip()
+            rendered = True
+
+    @classmethod
+    def stop(cls):
+        cls.run = False
 
 
 class JoinRoomScreen(Screen):
 
+    run = True
+    ip_address = ""
+    screen: pygame.Surface
+    clock: Clock
+
+    join_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 500)),
+        text_input="JOIN",
+        font=get_font(70),
+    )
+
+    back_button = StyledButton(
+        position=Position(coords=(config.SCREEN.centerx, 650)),
+        text_input="BACK",
+        font=get_font(50),
+    )
+
+    ip_field = StyledTextField(
+        font=get_font(60),
+        position=Position(coords=(config.SCREEN.centerx, 300)),
+        width=500,
+        text_align="center",
+    )
+
+    menu_text = OutlineText(
+        text="Enter IP Address",
+        font=get_font(80),
+        text_color=pygame.Color("white"),
+        outline_color=pygame.Color("black"),
+        position=Position(coords=(config.SCREEN.centerx, 100)),
+    )
+
+    elements: list[Element] = [back_button, join_button, ip_field]
+
     @classmethod
     def start(cls, screen: pygame.Surface, clock: Clock):
-        run = True
-
-        ip_address = GameManager.options.ip
-
-        def back_click():
-            nonlocal run
-            run = False
-
-        def join_click():
-            if not cls._is_valid_ip(ip_address):
-                return
-            OnlineClientGame.start(screen=screen, clock=clock, ip_address=ip_address)
-            GameManager.options.ip = ip_address
-            back_click()
-
-        join_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 500)),
-            text_input="JOIN",
-            font=get_font(70),
-            on_click=join_click,
-        )
+        cls.run = True
+        cls.screen = screen
+        cls.clock = clock
 
-        back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="BACK",
-            font=get_font(50),
-            on_click=back_click,
-        )
-        
-        def set_ip(ip: str):
-            nonlocal ip_address
-            ip_address = ip
-        
-        ip_field = StyledTextField(
-            font=get_font(60),
-            position=Position(coords=(config.SCREEN.centerx, 300)),
-            width=500,
-            default=ip_address,
-            on_value_changed=set_ip,
-            text_align="center",
-            on_enter=join_click
-        )
+        cls.ip_address = GameManager.options.ip
+        cls.ip_field.value = cls.ip_address
+        cls.ip_field.disabled = True
+        cls.ip_field.on_value_changed = cls.set_ip
+        cls.ip_field.on_enter = cls.join
+        cls.join_button.on_click = cls.join
+        cls.back_button.on_click = cls.stop
 
-        menu_text = OutlineText(
-            text="Enter IP Address",
-            font=get_font(80),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 100)),
-        )
-        
-        elements: list[Element] = [back_button, join_button, ip_field]
+        while cls.run:
 
-        while run:
+            clock.tick(config.MENU_FRAMERATE)
 
-            clock.tick(config.FRAMERATE)
+            cls.join_button.disabled = not cls._is_valid_ip(cls.ip_address)
 
-            join_button.disabled=not cls._is_valid_ip(ip_address)
-            
             GraphicsManager.render_background(screen)
-            
-            menu_text.update(screen)
-            
-            events = pygame.event.get()
+
+            cls.menu_text.update(screen)
+
+            events = cls.get_events()
             cls.check_quit(events=events, quit=GameManager.quit)
-            
-            cls.render_elements(screen=screen, elements=elements, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=elements))
-            
-            cls.click_elements(elements=elements, events=events)
+
+            cls.render_elements(screen=screen, elements=cls.elements, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.elements))
+
+            cls.click_elements(elements=cls.elements, events=events)
 
             pygame.display.flip()
-            
+
+    @classmethod
+    def stop(cls):
+        cls.run = False
+
+    @classmethod
+    def set_ip(cls, ip: str):
+        cls.ip_address = ip
+
+    @classmethod
+    def join(cls):
+        if not cls._is_valid_ip(cls.ip_address):
+            return
+        OnlineClientGame.start(
+            screen=cls.screen, clock=cls.clock, ip_address=cls.ip_address
+        )
+        GameManager.options.ip = cls.ip_address
+        cls.stop()
+
     @classmethod
     def _is_valid_ip(cls, address: str):
         try:
@@ -156,211 +174,257 @@ class JoinRoomScreen(Screen):
 
 class OnlineScreen(Screen):
 
-    @classmethod
-    def start(cls, screen: pygame.Surface, clock: Clock):
-        run = True
+    run = True
+    screen: pygame.Surface
+    clock: Clock
 
-        def back_click():
-            nonlocal run
-            run = False
+    join_room_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 270)),
+        text_input="JOIN ROOM",
+        font=get_font(70),
+    )
 
-        def join_room_click():
-            JoinRoomScreen.start(screen=screen, clock=clock)
-            back_click()
+    create_room_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 420)),
+        text_input="CREATE ROOM",
+        font=get_font(70),
+    )
 
-        def create_room_click():
-            LocalClientGame.start(screen=screen, clock=clock)
-            back_click()
+    back_button = StyledButton(
+        position=Position(coords=(config.SCREEN.centerx, 650)),
+        text_input="BACK",
+        font=get_font(50),
+    )
 
-        join_room_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 270)),
-            text_input="JOIN ROOM",
-            font=get_font(70),
-            on_click=join_room_click,
-        )
+    buttons: list[Element] = [join_room_button, back_button, create_room_button]
 
-        create_room_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 420)),
-            text_input="CREATE ROOM",
-            font=get_font(70),
-            on_click=create_room_click,
-        )
+    @classmethod
+    def start(cls, screen: pygame.Surface, clock: Clock):
+        cls.run = True
+        cls.screen = screen
+        cls.clock = clock
+        cls.join_room_button.on_click = cls.join_room
+        cls.create_room_button.on_click = cls.create_room
+        cls.back_button.on_click = cls.stop
 
-        back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="BACK",
-            font=get_font(50),
-            on_click=back_click,
-        )
+        rendered = False
+        while cls.run:
 
-        buttons = [join_room_button, back_button, create_room_button]
+            clock.tick(config.MENU_FRAMERATE)
+
+            events = cls.get_events()
+
+            cls.check_quit(events=events, quit=GameManager.quit)
 
-        while run:
+            # static screen: already drawn and nothing happened this frame
+            if rendered and not events.events:
+                continue
 
-            clock.tick(config.FRAMERATE)
             screen.fill("black")
 
             GraphicsManager.render_background(screen)
 
-            events = pygame.event.get()
-            
-            cls.check_quit(events=events, quit=GameManager.quit)
-            
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+            cls.render_elements(screen=screen, elements=cls.buttons, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.buttons))
 
-            cls.click_elements(elements=buttons, events=events)
+            cls.click_elements(elements=cls.buttons, events=events)
 
             pygame.display.flip()
+            # a click may have run another screen over this one; redraw next frame
+            rendered = not events.lmb_down
 
+    @classmethod
+    def stop(cls):
+        cls.run = False
 
-class PlayScreen(Screen):
+    @classmethod
+    def join_room(cls):
+        JoinRoomScreen.start(screen=cls.screen, clock=cls.clock)
+        cls.stop()
 
     @classmethod
-    def start(cls, screen: pygame.Surface, clock: Clock):
-        run = True
-
-        def back_button_click():
-            nonlocal run
-            run = False
-
-        def offline_button_click():
-            OfflineGame.start(screen=screen, clock=clock)
-            nonlocal run
-            run = False
-
-        def bot_button_click():
-            BotGame.start(screen=screen, clock=clock)
-            nonlocal run
-            run = False
-
-        def online_button_click():
-            OnlineScreen.start(screen, clock)
-
-        online_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 180)),
-            text_input="ON LAN",
-            font=get_font(75),
-            on_click=online_button_click,
-        )
+    def create_room(cls):
+        LocalClientGame.start(screen=cls.screen, clock=cls.clock)
+        cls.stop()
 
-        bot_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 330)),
-            text_input="AGAINST BOT",
-            font=get_font(75),
-            on_click=bot_button_click,
-        )
 
-        offline_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 480)),
-            text_input="1v1",
-            font=get_font(75),
-            on_click=offline_button_click,
-        )
+class PlayScreen(Screen):
 
-        back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="BACK",
-            font=get_font(50),
-            on_click=back_button_click,
-        )
+    run = True
+    screen: pygame.Surface
+    clock: Clock
+
+    online_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 180)),
+        text_input="ON LAN",
+        font=get_font(75),
+    )
+
+    bot_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 330)),
+        text_input="AGAINST BOT",
+        font=get_font(75),
+    )
+
+    offline_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 480)),
+        text_input="1v1",
+        font=get_font(75),
+    )
+
+    back_button = StyledButton(
+        position=Position(coords=(config.SCREEN.centerx, 650)),
+        text_input="BACK",
+        font=get_font(50),
+    )
+
+    buttons: list[Element] = [online_button, bot_button, offline_button, back_button]
+
+    @classmethod
+    def start(cls, screen: pygame.Surface, clock: Clock):
+        cls.run = True
+        cls.screen = screen
+        cls.clock = clock
+        cls.online_button.on_click = cls.play_online
+        cls.bot_button.on_click = cls.play_bot
+        cls.offline_button.on_click = cls.play_offline
+        cls.back_button.on_click = cls.stop
+
+        rendered = False
+        while cls.run:
+            clock.tick(config.MENU_FRAMERATE)
+
+            events = cls.get_events()
+            cls.check_quit(events=events, quit=GameManager.quit)
 
-        buttons = [online_button, bot_button, offline_button, back_button]
+            # static screen: already drawn and nothing happened this frame
+            if rendered and not events.events:
+                continue
 
-        while run:
             screen.fill("black")
             GraphicsManager.render_background(screen=screen)
-            clock.tick(config.FRAMERATE)
 
-            events = pygame.event.get()
-            cls.check_quit(events=events, quit=GameManager.quit)
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+            cls.render_elements(screen=screen, elements=cls.buttons, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.buttons))
 
-            cls.click_elements(elements=buttons, events=events)
+            cls.click_elements(elements=cls.buttons, events=events)
 
             pygame.display.flip()
+            # a click may have run another screen over this one; redraw next frame
+            rendered = not events.lmb_down
+
+    @classmethod
+    def stop(cls):
+        cls.run = False
+
+    @classmethod
+    def play_online(cls):
+        OnlineScreen.start(cls.screen, cls.clock)
+
+    @classmethod
+    def play_bot(cls):
+        BotGame.start(screen=cls.screen, clock=cls.clock)
+        cls.stop()
+
+    @classmethod
+    def play_offline(cls):
+        OfflineGame.start(screen=cls.screen, clock=cls.clock)
+        cls.stop()
 
 
 class OptionsScreen(Screen):
-    
+
+    run = True
+
     @classmethod
     def start(cls, screen: pygame.Surface, clock: Clock):
-        run = True
-        
-        def close():
-            nonlocal run
-            run = False
-        
-        while run:
-            events = pygame.event.get()
+        cls.run = True
+
+        while cls.run:
+            events = cls.get_events()
             cls.check_quit(events=events, quit=GameManager.quit)
-            
+
             GraphicsManager.render_background(screen=screen)
-            clock.tick(config.FRAMERATE)
-            OptionsMenu.start(screen=screen, on_top=False, close=close, events=events)
+            clock.tick(config.MENU_FRAMERATE)
+            OptionsMenu.start(screen=screen, on_top=False, close=cls.stop, events=events)
             pygame.display.flip()
 
-
-class MainScreen(Screen):
-
     @classmethod
-    def start(cls, screen: pygame.Surface, clock: Clock):
-        def play_button_click():
-            PlayScreen.start(screen=screen, clock=clock)
+    def stop(cls):
+        cls.run = False
 
-        def options_button_click():
-            OptionsScreen.start(screen=screen, clock=clock)
 
-        def quit_button_click():
-            GameManager.quit()
+class MainScreen(Screen):
 
-        main_menu = OutlineText(
-            text="MAIN MANU",
-            font=get_font(100),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 100)),
-        )
+    screen: pygame.Surface
+    clock: Clock
+
+    main_menu_text = OutlineText(
+        text="MAIN MANU",
+        font=get_font(100),
+        text_color=pygame.Color("white"),
+        outline_color=pygame.Color("black"),
+        position=Position(coords=(config.SCREEN.centerx, 100)),
+    )
+
+    play_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 300)),
+        text_input="PLAY",
+        font=get_font(75),
+    )
+
+    options_button = StyledBetterButton(
+        position=Position(coords=(config.SCREEN.centerx, 450)),
+        text_input="OPTIONS",
+        font=get_font(75),
+    )
+
+    quit_button = StyledButton(
+        position=Position(coords=(config.SCREEN.centerx, 650)),
+        text_input="QUIT",
+        font=get_font(50),
+    )
+
+    buttons: list[Element] = [play_button, options_button, quit_button]
 
-        play_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 300)),
-            text_input="PLAY",
-            font=get_font(75),
-            on_click=play_button_click,
-        )
+    @classmethod
+    def start(cls, screen: pygame.Surface, clock: Clock):
+        cls.screen = screen
+        cls.clock = clock
+        cls.play_button.on_click = cls.play
+        cls.options_button.on_click = cls.open_options
+        cls.quit_button.on_click = GameManager.quit
 
-        options_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 450)),
-            text_input="OPTIONS",
-            font=get_font(75),
-            on_click=options_button_click,
-        )
+        rendered = False
+        while True:
+            clock.tick(config.MENU_FRAMERATE)
 
-        quit_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="QUIT",
-            font=get_font(50),
-            on_click=quit_button_click,
-        )
+            events = cls.get_events()
+            cls.check_quit(events=events, quit=GameManager.quit)
 
-        buttons = [play_button, options_button, quit_button]
-        while True:
-            clock.tick(config.FRAMERATE)
+            # static screen: already drawn and nothing happened this frame
+            if rendered and not events.events:
+                continue
 
             screen.fill("black")
 
             GraphicsManager.render_background(screen=screen)
 
-            main_menu.update(screen)
+            cls.main_menu_text.update(screen)
 
-            events = pygame.event.get()
-            cls.check_quit(events=events, quit=GameManager.quit)
-            
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+            cls.render_elements(screen=screen, elements=cls.buttons, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.buttons))
+
+            cls.click_elements(elements=cls.buttons, events=events)
 
-            cls.click_elements(elements=buttons, events=events)
-        
             pygame.display.flip()
-            
\ No newline at end of file
+            # a click may have run another screen over this one; redraw next frame
+            rendered = not events.lmb_down
+
+    @classmethod
+    def play(cls):
+        PlayScreen.start(screen=cls.screen, clock=cls.clock)
+
+    @classmethod
+    def open_options(cls):
+        OptionsScreen.start(screen=cls.screen, clock=cls.clock)
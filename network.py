@@ -13,6 +13,10 @@ from models import OnlineGameState, ServerFlags
 from models import Move
 from pydantic_extra_types.color import Color
 import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class BGServer:
@@ -60,7 +64,7 @@ class BGServer:
         return self.online_backgammon.get_online_game_state()
 
     async def close_connection(self, writer: asyncio.StreamWriter, address: str):
-        print(f"Closing connection to {address}")
+        logger.info("Closing connection to %s", address)
         writer.close()
         await writer.wait_closed()
 
@@ -68,10 +72,10 @@ class BGServer:
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ):
         address = writer.get_extra_info(name="peername")
-        print(f"{address} connected to the server")
+        logger.info("%s connected to the server", address)
 
         if self.connected:
-            print(f"{address} joined to an active game")
+            logger.info("%s joined to an active game", address)
             await self.close_connection(writer=writer, address=address)
             return
 
@@ -84,10 +88,10 @@ class BGServer:
                     reader.read(self._buffer_size), timeout=self._timeout
                 )
                 if not raw_data:
-                    print(f"Received no data from {address}")
+                    logger.debug("Received no data from %s", address)
                     break
                 request = pickle.loads(raw_data)
-                print(f"Received data from {address}: {request}")
+                logger.debug("Received data from %s: %s", address, request)
                 if request == ServerFlags.get_current_state:
                     pass
                 elif request == ServerFlags.undo:
@@ -95,7 +99,7 @@ class BGServer:
                 elif request == ServerFlags.done:
                     self.done_turn()
                 elif request == ServerFlags.leave:
-                    print(f"Player2 ({address}) left the game.")
+                    logger.info("Player2 (%s) left the game.", address)
 
                     self.connected = False
                     self.online_backgammon.is_player2_connected = False
@@ -109,15 +113,15 @@ class BGServer:
 
                 response = self.online_backgammon.manipulate_board()
                 await self.send_data(writer=writer, data=response)
-                print(f"Data sent back to: {address}: {type(response)}")
+                logger.debug("Data sent back to: %s: %s", address, type(response))
 
             except TimeoutError:
-                print(f"Lost connection to {address}: waiting for connection")
+                logger.info("Lost connection to %s: waiting for connection", address)
                 self.connected = False
                 break
             except asyncio.CancelledError:
                 self.connected = False
-                print(f"Connection to {address} cancelled")
+                logger.info("Connection to %s cancelled", address)
                 break
 
         await self.close_connection(writer=writer, address=address)
@@ -128,12 +132,12 @@ class BGServer:
 
     def run_server(self):
         if self.server_thread is not None:
-            print("Server already running.")
+            logger.warning("Server already running.")
             return
 
         if self._stop_event.is_set():
             self._stop_event = asyncio.Event()
-            print("Starting again.")
+            logger.info("Starting again.")
 
         async def start_server():
             self.server = await asyncio.start_server(
@@ -145,13 +149,13 @@ class BGServer:
             addresses = ", ".join(
                 str(sock.getsockname()) for sock in self.server.sockets
             )
-            print(f"Serving on {addresses}")
+            logger.info("Serving on %s", addresses)
 
             async with self.server:
                 try:
                     await self.server.serve_forever()
                 except asyncio.CancelledError:
-                    print("Server stopped.")
+                    logger.info("Server stopped.")
 
         @run_threaded(daemon=True)
         def start():
@@ -162,7 +166,7 @@ class BGServer:
         self.server_thread = start()
 
     def stop_server(self):
-        print("Server shutting down")
+        logger.info("Server shutting down")
         self._stop_event.set()
 
         async def close_server():
@@ -236,13 +240,13 @@ class NetworkClient:
                 timeout=self._timeout,
             )
             self._started_event.set()
-            print(f"Connected to {self.host}")
+            logger.info("Connected to %s", self.host)
         except ConnectionRefusedError:
-            print(f"{self.host} refused to connect")
+            logger.warning("%s refused to connect", self.host)
             self._stop_event.set()
             return
         except:
-            print(f"Could not establish connection to {self.host}")
+            logger.warning("Could not establish connection to %s", self.host)
             self._stop_event.set()
             return
         # loop to send messages
@@ -254,12 +258,12 @@ class NetworkClient:
                 self.request_queue.task_done()
                 await self.handle_received_data(on_receive=on_receive, reader=reader)
             except EmptyQueueError:
-                print("Empty queue...")
+                logger.debug("Empty queue...")
                 continue
 
         writer.close()
         await writer.wait_closed()
-        print("closed writer")
+        logger.debug("closed writer")
 
     async def handle_send_data(self, data, writer: asyncio.StreamWriter):
         writer.write(pickle.dumps(data))
@@ -275,7 +279,7 @@ class NetworkClient:
             )
             if not raw_data:
                 self.disconnect(threaded=True)
-                print("Received no data, closing client")
+                logger.info("Received no data, closing client")
                 return
             # print("Data received.")
             data = pickle.loads(raw_data)
@@ -283,21 +287,21 @@ class NetworkClient:
             self.time_on_receive = time.time()
         except TimeoutError:
             self.disconnect(threaded=True)
-            print("Timed out... Closing client")
+            logger.warning("Timed out... Closing client")
         except Exception as ex:
             self.disconnect(threaded=True)
-            print(f"Un handled exception: {ex}")
+            logger.error("Un handled exception: %s", ex)
 
     def send(self, data, on_receive: Callable[[Any], None] = lambda x: None):
         if not self._started_event.is_set() or self._stop_event.is_set():
-            print("Not connected, cannot send")
+            logger.warning("Not connected, cannot send")
             return
         request = (data, on_receive)
         self.request_queue.put(request)
 
     def connect(self):
         if self.client_thread:
-            print(f"Already connected to {self.host}.")
+            logger.warning("Already connected to %s.", self.host)
 
         self.request_queue = Queue()
         self._started_event = asyncio.Event()
@@ -306,13 +310,13 @@ class NetworkClient:
         @run_threaded(daemon=True)
         def connect_threaded():
             asyncio.run(self.handle_connection())
-            print("Client disconnected")
+            logger.info("Client disconnected")
 
         self.client_thread = connect_threaded()
 
     def disconnect(self, data=None, threaded=False):
         if not self.client_thread:
-            print("Cannot disconnect. Client not connected")
+            logger.warning("Cannot disconnect. Client not connected")
             return
 
         if data is not None:
@@ -321,7 +325,7 @@ class NetworkClient:
         self._stop_event.set()
         if not threaded:
             self.client_thread.join()
-        print(f"Disconnected from: {self.host}")
+        logger.info("Disconnected from: %s", self.host)
         self.client_thread = None
 
     @property